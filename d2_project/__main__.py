@@ -1,10 +1,28 @@
 """Main script for testing."""
 
+# ==== Import Annotations From __future__ ====
+from __future__ import annotations
+
+# ==== Standard Library Imports ====
+from typing import TYPE_CHECKING
+
 # ==== Local Modules ====
 
-import d2_project.config.config as d2_project_config
-import d2_project.core.utils.mf as mf_utils
-import d2_project.schemas.mf as mf_schemas
+import d2_project.core.logger as d2_project_logger
+
+# ==== Logging Config ====
+# Configure before importing modules that build and validate settings, so
+# their import-time log records reach the configured handler
+d2_project_logger.configure_logging()
+
+import d2_project.config.config as d2_project_config  # noqa: E402
+import d2_project.core.utils.mf as mf_utils  # noqa: E402
+import d2_project.schemas.mf as mf_schemas  # noqa: E402
+import d2_project.schemas.mossy.mossy as mossy_schemas  # noqa: E402
+
+# ==== Type Checking ====
+if TYPE_CHECKING:
+    from pathlib import Path
 
 # ==== Execution ====
 
@@ -19,12 +37,16 @@ installed_mf_data: mf_schemas.InstalledManifestData = (
     mf_schemas.InstalledManifestData()
 )
 
+installed_mf_path: Path | None = installed_mf_data.installed_mf_path
+
 if mf_loc_data.remote_mf_name != (
-    installed_mf_data.installed_mf_path.name
-    if installed_mf_data.installed_mf_path is not None
-    else None
+    installed_mf_path.name if installed_mf_path is not None else None
 ):
     installed_mf_data.update_manifest(mf_loc_data)
 
 elif d2_project_config.settings.force_update:
     installed_mf_data.update_manifest(mf_loc_data, force_update=True)
+
+mossy_schemas.ensure_mossy_csv(
+    force_update=d2_project_config.settings.force_mossy_update,
+)
@@ -10,6 +10,7 @@ class defaults to regenerate a TOML file.
 from __future__ import annotations
 
 # ==== Standard Library Imports ====
+import re
 from dataclasses import MISSING, dataclass, fields
 from functools import cached_property
 from pathlib import Path
@@ -138,7 +139,7 @@ class ConfigSuperclass:
         """
         return d2_project_validators.str_matches_pattern(
             value=s,
-            pattern=d2_project_validators.toml_bare_key_pattern.pattern,
+            pattern=d2_project_validators.toml_bare_key_pattern.regex,
         )
 
     def _toml_serialise_string_value(self, string_value: str) -> str:
@@ -157,7 +158,7 @@ class ConfigSuperclass:
 
         if not d2_project_validators.str_matches_pattern(
             value=string_value,
-            pattern=needs_triple_quotes_pattern.pattern,
+            pattern=needs_triple_quotes_pattern.regex,
         ):
             return f'"{string_value}"'
 
@@ -313,11 +314,22 @@ class Sanity(ConfigSuperclass):
         """Post-initialisation."""
         d2_project_validators.assert_str_matches_pattern(
             value=self.expected_remote_lang_dir,
-            pattern=d2_project_validators.url_path_pattern.pattern,
+            pattern=d2_project_validators.url_path_pattern.regex,
             pattern_for=d2_project_validators.url_path_pattern.pattern_for,
             log_func=_logger.exception,
         )
 
+    # ==== Properties ====
+    @cached_property
+    def _expected_bungie_response_data_keys(self) -> frozenset[str]:
+        """Convert expected_bungie_response_data_fields to frozenset.
+
+        Returns:
+            frozenset[str]: Expected fields in Bungie response.
+
+        """
+        return frozenset(self.expected_bungie_response_data_fields)
+
     # ==== Methods ====
     def check_remote_mf_dir(
         self,
@@ -359,8 +371,8 @@ class Sanity(ConfigSuperclass):
             json_data (dict[str, Any]): Bungie response JSON data.
 
         """
-        diff: set[str] = set(json_data) - set(
-            self.expected_bungie_response_data_fields,
+        diff: set[str] = (
+            json_data.keys() - self._expected_bungie_response_data_keys
         )
 
         if diff:
@@ -450,6 +462,7 @@ class Settings(ConfigSuperclass):  # pylint: disable=too-many-instance-attribute
         _api_key_path_str (str): Path to API key TOML file.
         _mf_dir_path (str): Path to manifest directory as str.
         mf_bak_ext (str): Backup manifest file extension.
+        force_mossy_update (bool): Whether to force Mossy CSV update.
 
     """
 
@@ -479,6 +492,8 @@ class Settings(ConfigSuperclass):  # pylint: disable=too-many-instance-attribute
     _mf_dir_path: str = str(Path(__file__).resolve().parents[1] / "manifest")
     mf_bak_ext: str = ".bak"
 
+    # ==== Mossy Attributes ====
+    force_mossy_update: bool = False
     _mossy_sheet_id: str = "1b57Hb8m1L3daFfUckQQqvvN6VOpD03KEssvQLMFpC5I"
     _mossy_weapon_combat_scaling_gid: str = "282634418"
     _gsheets_base_url = "https://docs.google.com"
@@ -498,7 +513,11 @@ class Settings(ConfigSuperclass):  # pylint: disable=too-many-instance-attribute
                 value=suffix,
                 log_func=_logger.exception,
             )
-        for url in (self.mf_finder_url, self.mf_loc_base_url):
+        for url in (
+            self.mf_finder_url,
+            self.mf_loc_base_url,
+            self._gsheets_base_url,
+        ):
             d2_project_validators.str_is_valid_url(url)
         if not self.mf_dir_path.is_dir():
             _logger.critical(
@@ -569,6 +588,16 @@ class Settings(ConfigSuperclass):  # pylint: disable=too-many-instance-attribute
             extension=self.mf_extension,
         )
 
+    @cached_property
+    def expected_mf_name_pattern(self) -> re.Pattern[str]:
+        """Compile expected_mf_name_regex.
+
+        Returns:
+            re.Pattern[str]: Compiled expected manifest filename pattern.
+
+        """
+        return re.compile(self.expected_mf_name_regex)
+
     @cached_property
     def mf_response_structure(self) -> _ManifestResponseStructure:
         """Substitute and return _mf_response_structure.
@@ -610,7 +639,8 @@ class Settings(ConfigSuperclass):  # pylint: disable=too-many-instance-attribute
             sheet_id=self._mossy_sheet_id,
             gid=self._mossy_weapon_combat_scaling_gid,
         )
-        return general_schemas.ParsedURL.from_base_and_path(
+        # Base URL validated in __post_init__, path substituted from settings
+        return general_schemas.ParsedURL.from_parts(
             base_url=self._gsheets_base_url,
             path=subbed_path,
         ).url
@@ -4,14 +4,14 @@
 import logging
 
 
-def get_logger(name: str) -> logging.Logger:
-    """Get logger.
+def configure_logging() -> None:
+    """Configure root logging for the application.
 
-    Args:
-        name (str): Module/package name.
+    Should be called once, from the application entry point, rather than by
+    library code at import time.
 
     Returns:
-        logging.Logger: Logger.
+        None.
 
     """
     logging.basicConfig(
@@ -21,4 +21,15 @@ def get_logger(name: str) -> logging.Logger:
         format="%(asctime)s - %(levelname)s - %(message)s",
     )
 
+
+def get_logger(name: str) -> logging.Logger:
+    """Get logger.
+
+    Args:
+        name (str): Module/package name.
+
+    Returns:
+        logging.Logger: Logger.
+
+    """
     return logging.getLogger(name)
@@ -5,8 +5,8 @@
 from __future__ import annotations
 
 # ==== Standard Libraries ====
+import os
 import shutil
-import tempfile
 import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -18,74 +18,12 @@ import d2_project.core.validators as d2_project_validators
 # ==== Type Checking ====
 if TYPE_CHECKING:
     from logging import Logger
-    from typing import Callable
-    from zipfile import ZipInfo
 
 # ==== Logging Config ====
 _logger: Logger = d2_project_logger.get_logger(__name__)
 
 
 # ==== Functions ====
-def mv_item(
-    *,
-    src: Path,
-    dst: Path,
-    overwrite: bool = False,
-) -> None:
-    """Move a file or directory from 'src' to 'dst'.
-
-    If 'dst' is an existing directory, the source item is moved inside it
-    with the same name. If 'dst' is a file path, the source is moved/renamed
-    to that path directly.
-
-    Args:
-        src (Path): Path to the source file or directory.
-        dst (Path): Destination directory or file path.
-        overwrite (bool): If True, overwrite existing files or directories
-            at the destination. If False and a target exists, raises
-                FileExistsError.
-
-    Raises:
-        FileExistsError: If the target path exists and 'overwrite' is False, or
-            if attempting to move directory onto file path.
-
-    Notes:
-        Do not call this function many times instead of using shutil.move().
-
-    """
-    src = src.resolve()
-    dst = dst.resolve()
-
-    # Validate entry type compatibility and assign 'target_path'
-    target_path: Path = dst
-    if dst.is_dir():
-        target_path = dst / src.name
-    elif src.is_dir():
-        _logger.critical(
-            "Cannot move directory '%s' to file path '%s'.",
-            src,
-            dst,
-        )
-        raise FileExistsError
-
-    # Check and clear 'target_path' if 'overwrite==True', else raise
-    if target_path.exists():
-        if not overwrite:
-            _logger.critical(
-                "Cannot move file: destination '%s' already exists. Source: "
-                "'%s'",
-                src,
-                target_path,
-            )
-            raise FileExistsError
-        if target_path.is_dir():
-            shutil.rmtree(target_path)
-        else:
-            target_path.unlink()
-
-    shutil.move(str(src), str(target_path))
-
-
 def extract_zip(
     *,
     zip_path: Path,
@@ -99,8 +37,9 @@ def extract_zip(
     This function validates input paths and ensures the extraction
     destination exists. If 'expected_file_count' or 'expected_dir_count' is
     provided, the archive is first inspected and the actual file/directory
-    counts are checked. Contents are then extracted to a temporary directory
-    and moved to the final destination.
+    counts are checked. Top-level entries that already exist in the
+    destination are then either cleared (if 'overwrite') or reported, before
+    the contents are extracted directly to the destination.
 
     Args:
         zip_path (Path): Path to the ZIP archive.
@@ -115,63 +54,73 @@ def extract_zip(
 
     Raises:
         NotADirectoryError: If 'extract_to' exists but is not a directory.
+        FileExistsError: If an archive entry already exists in 'extract_to'
+            and 'overwrite' is False.
 
     """
-    has_expectation: bool = (
-        expected_file_count is not None or expected_dir_count is not None
-    )
-
     d2_project_validators.entry_is_file(zip_path)
 
-    # Raise if 'extract_to' exists AND isn't a directory
-    if extract_to.exists() and not extract_to.is_dir():
+    # Create 'extract_to' directory, if none exists; mkdir() raises
+    # FileExistsError if it exists AND isn't a directory
+    try:
+        extract_to.mkdir(parents=True, exist_ok=True)
+    except FileExistsError:
         _logger.critical(
             "Must extract to a directory; '%s' is not a directory",
             extract_to.resolve(),
         )
-        raise NotADirectoryError
-    # Create 'extract_to' directory, if none exists
-    extract_to.mkdir(parents=True, exist_ok=True)
-
-    with tempfile.TemporaryDirectory() as tmp:
-        # Assign 'tmp_path' (path to tmp)
-        tmp_path: Path = Path(tmp)
-
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            # Execute if some count of dirs and/or files expected
-            if has_expectation:
-                # Assign 'zip_contents' for re-use
-                zip_contents = zip_ref.infolist()
-
-                # Validate expected counts of files and/or dirs\
-                expected_counts: list[
-                    tuple[str, int | None, Callable[[ZipInfo], bool]]
-                ] = [
-                    ("file", expected_file_count, lambda e: not e.is_dir()),
-                    ("dir", expected_dir_count, lambda e: e.is_dir()),
-                ]
-                for entry_type, expected, predicate in expected_counts:
-                    # Execute only if expected_*_count passed
-                    if expected is not None:
-                        d2_project_validators.expected_entry_count(
-                            entry_type=entry_type,
-                            expected=expected,
-                            actual=sum(
-                                1 for e in zip_contents if predicate(e)
-                            ),
-                            entry_source=zip_path,
-                        )
-            # Extract archive (at 'zip_path') contents to 'tmp'
-            zip_ref.extractall(tmp)
-
-        # Move each file in 'tmp' to 'extract_to', overwriting existing
-        # files if 'overwrite'==True
-        for file in tmp_path.iterdir():
-            mv_item(
-                src=file,
-                dst=extract_to,
-                overwrite=overwrite,
+        raise NotADirectoryError from None
+
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        # Member names, shared by the count check and the clash preflight
+        names: list[str] = zip_ref.namelist()
+
+        # Execute if some count of dirs and/or files expected
+        if expected_file_count is not None or expected_dir_count is not None:
+            # Count dirs (names ending in '/') in a single pass; rest are files
+            dir_count: int = sum(name.endswith("/") for name in names)
+            file_count: int = len(names) - dir_count
+
+            # Validate expected counts of files and/or dirs
+            expected_counts: tuple[tuple[str, int | None, int], ...] = (
+                ("file", expected_file_count, file_count),
+                ("dir", expected_dir_count, dir_count),
             )
+            for entry_type, expected, actual in expected_counts:
+                # Execute only if expected_*_count passed
+                if expected is not None:
+                    d2_project_validators.expected_entry_count(
+                        entry_type=entry_type,
+                        expected=expected,
+                        actual=actual,
+                        entry_source=zip_path,
+                    )
+
+        # Preflight top-level entries that would collide in 'extract_to'
+        top_level_names: set[str] = {name.partition("/")[0] for name in names}
+        with os.scandir(extract_to) as it:
+            clashes: list[os.DirEntry[str]] = [
+                entry for entry in it if entry.name in top_level_names
+            ]
+
+        if clashes and not overwrite:
+            _logger.critical(
+                "Cannot extract '%s': entries already exist in '%s': %s.",
+                zip_path,
+                extract_to,
+                [clash.name for clash in clashes],
+            )
+            raise FileExistsError
+
+        # Clear clashing entries so the archive's entries replace them
+        for clash in clashes:
+            if clash.is_dir(follow_symlinks=False):
+                shutil.rmtree(clash.path)
+            else:
+                os.unlink(clash.path)
+
+        # Extract archive (at 'zip_path') contents directly to 'extract_to'
+        zip_ref.extractall(extract_to)
 
 
 def rm_sibling_files(files_to_keep: set[Path]) -> None:
@@ -188,16 +137,15 @@ def rm_sibling_files(files_to_keep: set[Path]) -> None:
         None.
 
     Raises:
-        ValueError: If 'files_to_keep' is empty or if the files are not all
-            in the same directory.
+        ValueError: If the files in 'files_to_keep' are not all existing
+            files in the same directory.
+        StopIteration: If 'files_to_keep' is empty.
         OSError: If an error occurs while attempting to delete a file.
 
     """
-    keep = {f.resolve() for f in files_to_keep}
-
     # Validate non-emptiness of 'files_to_keep' and assign 'sample_file'
     try:
-        sample_file = next(iter(keep))
+        sample_file = next(iter(files_to_keep))
     except StopIteration:
         _logger.critical(
             "Passed 'files_to_keep' empty: must include a non-zero exception "
@@ -207,9 +155,8 @@ def rm_sibling_files(files_to_keep: set[Path]) -> None:
 
     directory = sample_file.parent
 
-    # Validate 'files_to_keep'
-    for f in keep:
-        d2_project_validators.entry_is_file(f)
+    # Validate 'files_to_keep' are siblings (no syscalls needed)
+    for f in files_to_keep:
         if f.parent != directory:
             _logger.critical(
                 "Passed file-to-keep '%s' not in same directory as other "
@@ -219,15 +166,40 @@ def rm_sibling_files(files_to_keep: set[Path]) -> None:
             )
             raise ValueError
 
-    # Unlink non-'files_to_keep' paths
-    for item in directory.iterdir():
-        if item not in keep and (item.is_file() or item.is_symlink()):
+    # Siblings share 'directory', so names identify them without resolve()
+    keep_names: set[str] = {f.name for f in files_to_keep}
+
+    # Scan 'directory' once; DirEntry types double as keep-file validation
+    with os.scandir(directory) as it:
+        entries: list[os.DirEntry[str]] = list(it)
+
+    missing_names: set[str] = keep_names - {
+        entry.name
+        for entry in entries
+        if entry.name in keep_names and entry.is_file()
+    }
+    if missing_names:
+        _logger.critical(
+            "Passed files-to-keep %s must refer to files in '%s'.",
+            sorted(missing_names),
+            directory,
+        )
+        raise ValueError
+
+    # Unlink non-'files_to_keep' paths, using cached DirEntry types
+    for entry in entries:
+        if entry.name not in keep_names and (
+            entry.is_file(follow_symlinks=False) or entry.is_symlink()
+        ):
             try:
-                item.unlink()
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                # Already gone since the scan; nothing left to remove
+                continue
             except OSError:
                 _logger.critical(
                     "Failed to delete item '%s' from '%s'.",
-                    item.name,
+                    entry.name,
                     directory,
                 )
                 raise
@@ -262,12 +234,18 @@ def append_suffix(*, path: Path, suffix: str, overwrite: bool = False) -> Path:
 
     """
     d2_project_validators.entry_is_file(path)
-    d2_project_validators.str_is_valid_suffix(
+
+    # Prepend '.' if missing, as documented
+    if suffix[:1] != ".":
+        suffix = "." + suffix
+
+    d2_project_validators.assert_str_is_valid_suffix(
         value=suffix,
         log_func=_logger.exception,
     )
 
-    new_path: Path = path.with_name(path.name + suffix)
+    # Plain string concatenation avoids re-parsing via with_name()
+    new_path: Path = type(path)(os.fspath(path) + suffix)
 
     return _update_filename(
         old_path=path,
@@ -299,7 +277,8 @@ def rm_final_suffix(*, path: Path, overwrite: bool = False) -> Path:
         _logger.critical("File '%s' has no suffix to be removed.", path)
         raise ValueError
 
-    new_path: Path = path.with_suffix("")
+    # Slice the validated suffix off rather than re-parsing via with_suffix()
+    new_path: Path = type(path)(os.fspath(path)[: -len(path.suffix)])
 
     return _update_filename(
         old_path=path,
@@ -330,7 +309,8 @@ def _update_filename(
         FileExistsError: If 'new_path' exists and overwrite is False.
 
     """
-    if new_path.exists() and not overwrite:
+    # replace() overwrites atomically, so only check when not overwriting
+    if not overwrite and new_path.exists():
         _logger.exception("File with path '%s' already exists.", new_path)
         raise FileExistsError
 
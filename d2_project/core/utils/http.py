@@ -0,0 +1,44 @@
+"""Utilities pertaining to HTTP sessions."""
+
+from __future__ import annotations
+
+# ==== Standard Libraries ====
+from functools import cache
+
+# ==== Non-Standard Libraries ====
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ==== Functions ====
+
+
+@cache
+def get_session() -> requests.Session:
+    """Get the process-wide HTTP session.
+
+    The session is built once and shared, so requests to the same host reuse
+    pooled keep-alive connections. Idempotent GETs are retried with backoff
+    on connection errors and transient status codes.
+
+    Returns:
+        requests.Session: Shared session with retrying adapter on https.
+
+    """
+    session: requests.Session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False,
+            ),
+        ),
+    )
+
+    return session
@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 # ==== Standard Libraries ====
+import shutil
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 # ==== Non-Standard Libraries ====
 import requests
+import urllib3.exceptions
 
 # ==== Local Modules ====
 import d2_project.core.logger as d2_project_logger
 import d2_project.core.utils.general as general_utils
+import d2_project.core.utils.http as http_utils
 
 # ==== Type Checking ====
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from logging import Logger
     from typing import IO
 
@@ -52,7 +56,11 @@ def request_bungie(
     """
     headers = {"X-API-KEY": key} if key else None
 
-    response = requests.get(url, headers=headers, timeout=(3, 5))
+    response = http_utils.get_session().get(
+        url,
+        headers=headers,
+        timeout=(3, 5),
+    )
 
     if not response.ok:
         _logger.exception(
@@ -71,6 +79,7 @@ def dl_bungie_content(
     file_path: Path,
     url: str,
     stream: bool = True,
+    chunk_size: int = 1024 * 1024,
 ) -> bool:
     """Download and write Bungie content to a file.
 
@@ -83,23 +92,35 @@ def dl_bungie_content(
         file_path (Path): Path to file.
         url (str): The URL to query for the content.
         stream (bool): Whether or not to stream the file (defaults to True).
+        chunk_size (int): Size in bytes of each streamed read (defaults to
+            1 MiB).
 
     Returns:
         bool: To distinguish between errors writing the file with this
             function and other contexts.
 
     Raises:
+        requests.RequestException: If the request or reading the response
+            body fails (e.g. the connection drops mid-download).
         OSError: If another OSError occurs with writing the file.
 
     """
     try:
-        with requests.get(url, stream=stream, timeout=(3, 10)) as response:
+        with http_utils.get_session().get(
+            url,
+            stream=stream,
+            timeout=(3, 10),
+        ) as response:
             response.raise_for_status()
 
-            # Option to stream large files
+            # Option to stream large files, copying in 'chunk_size' blocks
             if stream:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
+                response.raw.decode_content = True
+                try:
+                    shutil.copyfileobj(response.raw, file, length=chunk_size)
+                except urllib3.exceptions.HTTPError as e:
+                    # Reading 'raw' bypasses requests' exception translation
+                    raise requests.ConnectionError(e) from e
             else:
                 file.write(response.content)
 
@@ -122,7 +143,7 @@ def dl_and_extract_mf_zip(
     *,
     url: str,
     mf_dir_path: Path,
-    mf_zip_structure: dict[str, int],
+    mf_zip_structure: Mapping[str, int],
     overwrite: bool = False,
 ) -> None:
     """Download and extract archive containing manifest files.
@@ -130,12 +151,14 @@ def dl_and_extract_mf_zip(
     Args:
         url (str): URL to manifest archive.
         mf_dir_path (Path): Directory to install manifest to.
-        mf_zip_structure (dict[str, int]): Expected structure of archive.
+        mf_zip_structure (Mapping[str, int]): Expected structure of archive.
         overwrite (bool, optional): Whether to overwrite existing manifests
             (defaults to False).
 
     """
-    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+    # Removed on context exit, but stays on disk when closed so it can be
+    # reopened for extraction (on all platforms)
+    with tempfile.NamedTemporaryFile(delete_on_close=False) as tmp:
         tmp_path = Path(tmp.name)
 
         dl_bungie_content(
@@ -145,8 +168,8 @@ def dl_and_extract_mf_zip(
             stream=True,
         )
 
-        tmp.flush()
-    try:
+        tmp.close()
+
         general_utils.extract_zip(
             zip_path=tmp_path,
             extract_to=mf_dir_path,
@@ -154,5 +177,3 @@ def dl_and_extract_mf_zip(
             expected_file_count=mf_zip_structure["expected_file_count"],
             overwrite=overwrite,
         )
-    finally:
-        tmp_path.unlink(missing_ok=True)
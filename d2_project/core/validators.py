@@ -4,7 +4,9 @@ from __future__ import annotations
 
 # ==== Standard Libraries ====
 import re
+import string
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
 # ==== Non-Standard Libraries ====
@@ -23,6 +25,10 @@ if TYPE_CHECKING:
 # ==== Logging Config ====
 _logger: Logger = d2_project_logger.get_logger(__name__)
 
+# ==== Cached Third-Party Validators ====
+# validators.url() is a pure, regex-heavy check; the same few URLs recur.
+_cached_url_validator = lru_cache(maxsize=256)(validators.url)
+
 
 # ==== ComparePatterns ====
 @dataclass
@@ -38,6 +44,16 @@ class ComparePattern:
     pattern: str
     pattern_for: str
 
+    @cached_property
+    def regex(self) -> re.Pattern[str]:
+        """Compile pattern.
+
+        Returns:
+            re.Pattern[str]: Compiled pattern.
+
+        """
+        return re.compile(self.pattern)
+
 
 lc_checksum_pattern: ComparePattern = ComparePattern(
     pattern=r"^[a-f0-9]{32}$",
@@ -59,6 +75,15 @@ toml_needs_triple_quotes_pattern: ComparePattern = ComparePattern(
     pattern_for="TOML triple-quotable string",
 )
 
+file_suffix_pattern: ComparePattern = ComparePattern(
+    pattern=r"\.[A-Za-z0-9._-]+",
+    pattern_for="file suffix",
+)
+
+_file_suffix_chars: frozenset[str] = frozenset(
+    string.ascii_letters + string.digits + "._-",
+)
+
 mossy_csv_filename_pattern: ComparePattern = ComparePattern(
     pattern=r"^mossy_csv_v[1-9]\d*(\.[1-9]\d*)*\.csv$",
     pattern_for="Mossy CSV filename",
@@ -119,25 +144,28 @@ def expected_entry_count(
 def str_matches_pattern(
     *,
     value: str,
-    pattern: str,
+    pattern: str | re.Pattern[str],
 ) -> bool:
     """Validate string-pattern match.
 
     Args:
         value (str): Value to check.
-        pattern (str): Pattern to check against.
+        pattern (str | re.Pattern[str]): Pattern to check against. Passing a
+            compiled pattern skips the 're' module cache lookup.
 
     Returns:
         bool: Returns True if match success.
 
     """
+    if isinstance(pattern, re.Pattern):
+        return bool(pattern.fullmatch(value))
     return bool(re.fullmatch(pattern, value))
 
 
 def assert_str_matches_pattern(
     *,
     value: str,
-    pattern: str,
+    pattern: str | re.Pattern[str],
     pattern_for: str,
     log_func: Callable[..., None] | None = None,
 ) -> None:
@@ -145,7 +173,7 @@ def assert_str_matches_pattern(
 
     Args:
         value (str): Value to check.
-        pattern (str): Pattern to check against.
+        pattern (str | re.Pattern[str]): Pattern to check against.
         pattern_for (str): Short description of pattern purpose.
         log_func (Callable[..., None] | None): Logging function (defaults to
             None).
@@ -159,16 +187,19 @@ def assert_str_matches_pattern(
     """
     str_matches: bool = str_matches_pattern(value=value, pattern=pattern)
     if not str_matches:
+        pattern_str: str = (
+            pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+        )
         if log_func is not None:
             log_func(
                 "Value %s not a valid %s: Expected pattern: %s.",
                 value,
-                pattern,
                 pattern_for,
+                pattern_str,
             )
         raise d2_project_errors.PatternMismatchError(
             value=value,
-            pattern=pattern,
+            pattern=pattern_str,
             pattern_for=pattern_for,
         )
 
@@ -180,14 +211,55 @@ def assert_str_is_valid_suffix(
 ) -> None:
     """Simplified pattern call for suffix to avoid code dupe.
 
+    The common valid case is checked with a set lookup; the regex check is
+    only run on failure, to raise the usual error.
+
     Returns:
         bool: True if pattern matched, else custom error raised.
 
     """
+    if (
+        len(value) > 1
+        and value[0] == "."
+        and _file_suffix_chars.issuperset(value[1:])
+    ):
+        return
+
+    assert_str_matches_pattern(
+        value=value,
+        pattern=file_suffix_pattern.regex,
+        pattern_for=file_suffix_pattern.pattern_for,
+        log_func=log_func,
+    )
+
+
+def assert_str_is_lc_checksum(
+    *,
+    value: str,
+    log_func: Callable[..., None],
+) -> None:
+    """Validate lowercase checksum without invoking the regex engine.
+
+    A lowercase checksum is 32 characters from '0-9a-f', so stripping those
+    characters leaves an empty string only if no other character is present.
+    The regex check is only run on failure, to raise the usual error.
+
+    Args:
+        value (str): Value to check.
+        log_func (Callable[..., None]): Logging function.
+
+    Raises:
+        d2_project_errors.PatternMismatchError: If value is not a lowercase
+            checksum.
+
+    """
+    if len(value) == 32 and not value.strip("0123456789abcdef"):
+        return
+
     assert_str_matches_pattern(
         value=value,
-        pattern=r"\.[A-Za-z0-9._-]+",
-        pattern_for="file suffix",
+        pattern=lc_checksum_pattern.regex,
+        pattern_for=lc_checksum_pattern.pattern_for,
         log_func=log_func,
     )
 
@@ -220,6 +292,6 @@ def str_is_valid_url(value: str) -> None:
         ValueError: If URL invalid.
 
     """
-    if not validators.url(value):
+    if not _cached_url_validator(value):
         _logger.error("URL '%s' invalid.", value)
         raise ValueError
@@ -4,12 +4,9 @@ from __future__ import annotations
 
 # ==== Standard Libraries ====
 import hashlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
-from urllib.parse import urljoin, urlparse
-
-# ==== Non-Standard Libraries ====
-import validators
+from urllib.parse import urlsplit
 
 # ==== Local Libraries ====
 import d2_project.core.logger as d2_project_logger
@@ -20,7 +17,7 @@ import d2_project.core.validators as d2_project_validators
 if TYPE_CHECKING:
     from logging import Logger
     from pathlib import Path
-    from urllib.parse import ParseResult
+    from urllib.parse import SplitResult
 
 # ==== Logging Config ====
 _logger: Logger = d2_project_logger.get_logger(__name__)
@@ -28,39 +25,42 @@ _logger: Logger = d2_project_logger.get_logger(__name__)
 # ==== Classes ====
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MD5Checksum:
     """Custom class for MD5 checksums.
 
+    Instances compare equal, and hash, by their raw digest bytes only.
+
     Attributes:
         val (str): Checksum value.
         from_calc (bool): Whether class instance was generated by from_calc
             class method.
+        _digest (bytes): Raw 16-byte digest of 'val'.
 
     """
 
-    val: str
-    from_calc: bool = False
+    val: str = field(compare=False)
+    from_calc: bool = field(default=False, compare=False)
+    _digest: bytes = field(init=False, repr=False)
 
     # ==== Initialisation and Validation ====
 
     def __post_init__(self) -> None:
         """Post-initialisation code.
 
-        This post-initialisation code validates the checksum value and sets the
-        value to all lowercase.
+        This post-initialisation code validates the checksum value, sets the
+        value to all lowercase and stores the raw digest for comparisons.
         """
         lc_val = self.val.lower()
 
         if not self.from_calc:
-            d2_project_validators.assert_str_matches_pattern(
+            d2_project_validators.assert_str_is_lc_checksum(
                 value=lc_val,
-                pattern=d2_project_validators.lc_checksum_pattern.pattern,
-                pattern_for=d2_project_validators.lc_checksum_pattern.pattern_for,
                 log_func=_logger.exception,
             )
 
         object.__setattr__(self, "val", lc_val)
+        object.__setattr__(self, "_digest", bytes.fromhex(lc_val))
 
     # ==== Public Methods ====
 
@@ -76,14 +76,11 @@ class MD5Checksum:
 
         """
         d2_project_validators.entry_is_file(path)
-        # Assign 'hasher' - an MD5 hash object. Using MD5 for file integrity
-        # verification only (not cryptographic security).
-        hasher = hashlib.md5()  # noqa: S324
 
         with path.open("rb") as f:
-            # Update 'hasher' with each 8KB chunk
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
+            # Read and hash in C. Using MD5 for file integrity verification
+            # only (not cryptographic security).
+            hasher = hashlib.file_digest(f, "md5")
 
         # Return 'hexdigest()' of 'hasher' MD5 hash object
         return cls(hasher.hexdigest(), from_calc=True)
@@ -122,13 +119,13 @@ class MD5Checksum:
             )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedURL:
     """Represents a URL with its base URL and path components.
 
-    This class parses the provided URL into its base URL and path
-    components. It also allows reconstruction of the full URL from these
-    components.
+    Only the full URL is stored; its base URL and path components are
+    parsed lazily on access (parses are memoised per URL string). It also
+    allows construction of the full URL from these components.
 
     Attributes:
         url (str): The full URL, including the base URL and path.
@@ -140,8 +137,29 @@ class ParsedURL:
     """
 
     url: str
-    base_url: str
-    path: str
+
+    # ==== Properties ====
+
+    @property
+    def base_url(self) -> str:
+        """Scheme and netloc of the URL, parsed on access.
+
+        Returns:
+            str: The base URL (e.g., 'https://example.com').
+
+        """
+        parsed_url: SplitResult = urlsplit(self.url)
+        return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+    @property
+    def path(self) -> str:
+        """Path component of the URL, parsed on access.
+
+        Returns:
+            str: The path, without leading or trailing slashes.
+
+        """
+        return urlsplit(self.url).path.strip("/")
 
     # ==== Public Methods ====
 
@@ -162,20 +180,9 @@ class ParsedURL:
         """
         full_url = full_url.strip().rstrip("/")
 
-        if not validators.url(full_url):
-            _logger.exception("Passed URL '%s' is an invalid URL.", full_url)
-            raise ValueError
-
-        parsed_url: ParseResult = urlparse(full_url)
+        d2_project_validators.str_is_valid_url(full_url)
 
-        computed_base_url: str = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        computed_path: str = parsed_url.path.strip("/")
-
-        return cls(
-            url=full_url,
-            base_url=computed_base_url,
-            path=computed_path,
-        )
+        return cls(url=full_url)
 
     @classmethod
     def from_base_and_path(cls, *, base_url: str, path: str) -> ParsedURL:
@@ -190,14 +197,30 @@ class ParsedURL:
                 URL.
 
         """
-        cleaned_base_url = base_url.strip().rstrip("/")
-        cleaned_path = path.strip().strip("/")
+        parsed_url: ParsedURL = cls.from_parts(base_url=base_url, path=path)
+
+        d2_project_validators.str_is_valid_url(parsed_url.url)
+
+        return parsed_url
+
+    @classmethod
+    def from_parts(cls, *, base_url: str, path: str) -> ParsedURL:
+        """Create a URL instance from a trusted base URL and path.
 
-        computed_url = urljoin(cleaned_base_url + "/", cleaned_path)
+        Unlike from_base_and_path(), the combined URL is not validated, so
+        this should only be used where 'base_url' has already been validated
+        and 'path' is known to be clean.
 
-        parsed_url: ParseResult = urlparse(computed_url)
-        full_path = parsed_url.path
+        Args:
+            base_url (str): The base URL, including scheme and netloc.
+            path (str): The path component to append to the base URL.
 
-        d2_project_validators.str_is_valid_url(computed_url)
+        Returns:
+            ParsedURL: An instance of the ParsedURL class with the combined
+                URL.
+
+        """
+        cleaned_base_url = base_url.strip().rstrip("/")
+        cleaned_path = path.strip().strip("/")
 
-        return cls(url=computed_url, base_url=cleaned_base_url, path=full_path)
+        return cls(url=f"{cleaned_base_url}/{cleaned_path}")
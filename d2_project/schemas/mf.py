@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 # ==== Standard Libraries ====
-from dataclasses import Field, dataclass, fields
-from functools import cached_property
+import json
+import os
+from dataclasses import dataclass, fields
+from functools import cache, cached_property, lru_cache
+from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 # ==== Non-Standard Libraries ====
@@ -20,8 +24,8 @@ import d2_project.schemas.general as general_schemas
 
 # ==== Type Checking ====
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from logging import Logger
-    from pathlib import Path
 
     from requests.models import Response
 
@@ -32,6 +36,40 @@ _logger: Logger = d2_project_logger.get_logger(__name__)
 T = TypeVar("T")
 
 
+# ==== Functions ====
+@cache
+def _mf_zip_structure_dict() -> Mapping[str, int]:
+    """Return read-only dict of configured manifest zip structure.
+
+    The configured structure is immutable at runtime, so the dict is built
+    once and reused for every manifest update.
+
+    Returns:
+        Mapping[str, int]: Expected structure of manifest archive.
+
+    """
+    return MappingProxyType(
+        d2_project_config.settings.mf_zip_structure.to_dict(),
+    )
+
+
+@lru_cache(maxsize=64)
+def _mf_name_pattern_expected(name: str) -> bool:
+    """Whether a manifest filename matches the expected pattern (memoised).
+
+    Args:
+        name (str): Manifest filename.
+
+    Returns:
+        bool: Whether 'name' matches the pattern in d2_project_config.settings.
+
+    """
+    return d2_project_validators.str_matches_pattern(
+        value=name,
+        pattern=d2_project_config.settings.expected_mf_name_pattern,
+    )
+
+
 # ==== Classes ===
 @dataclass(frozen=True)
 class BungieResponseData:
@@ -167,7 +205,8 @@ class BungieResponseData:
             dict[str, Any]: Parsed Response.
 
         """
-        json_data: dict[str, Any] = self.raw_data.json()
+        # Decode straight from bytes, skipping requests' text decode pass
+        json_data: dict[str, Any] = json.loads(self.raw_data.content)
 
         d2_project_config.sanity.check_extra_bungie_response_fields(json_data)
 
@@ -188,7 +227,7 @@ class ManifestLocationData(BungieResponseData):
         )
         d2_project_validators.assert_str_matches_pattern(
             value=self.remote_mf_name,
-            pattern=d2_project_config.settings.expected_mf_name_regex,
+            pattern=d2_project_config.settings.expected_mf_name_pattern,
             pattern_for="manifest file",
             log_func=_logger.exception,
         )
@@ -198,27 +237,18 @@ class ManifestLocationData(BungieResponseData):
         mf_response_structure = (
             d2_project_config.settings.mf_response_structure
         )
-        key = cast(Field[Any], None)  # noqa: TC006
-        try:
-            for key in (fields(mf_response_structure))[:-1]:
-                response_delver = response_delver[
-                    getattr(
-                        mf_response_structure,
-                        key.name,
-                    )
-                ]
+        for key in fields(mf_response_structure)[:-1]:
+            response_key: str = getattr(mf_response_structure, key.name)
+            delved: dict[str, Any] | None = response_delver.get(response_key)
+
+            if delved is None:
+                _logger.error(
+                    "Missing required field in response: %s.",
+                    response_key,
+                )
+                raise KeyError(response_key)
 
-        except KeyError:
-            missing_field_value: str = (
-                getattr(mf_response_structure, key.name)
-                if key
-                else "<unknown>"
-            )
-            _logger.exception(
-                "Missing required field in response: %s.",
-                missing_field_value,
-            )
-            raise
+            response_delver = delved
         return response_delver
 
     @cached_property
@@ -269,7 +299,7 @@ class ManifestLocationData(BungieResponseData):
             str: Manifest name.
 
         """
-        return self.remote_mf_path.split("/")[-1]
+        return self.remote_mf_path.rpartition("/")[2]
 
     @cached_property
     def remote_mf_url(self) -> general_schemas.ParsedURL:
@@ -285,7 +315,7 @@ class ManifestLocationData(BungieResponseData):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InstalledManifestData:
     """Dataclass for installed manifest data."""
 
@@ -302,33 +332,32 @@ class InstalledManifestData:
             None: If no installed manifest exists.
 
         """
-        mf_dir_path: Path = d2_project_config.settings.mf_dir_path
-
-        mf_candidates: list[Path] = []
-        for entry in mf_dir_path.iterdir():
-            if (
-                entry.suffix == (d2_project_config.settings.mf_extension)
-                and entry.is_file()
-            ):
-                mf_candidates.append(entry)
-
-                # Raise early once more than one candidate found
-                if len(mf_candidates) > 1:
-                    _logger.exception(
-                        "Directory '%s contains too many manifest candidates, "
-                        "including both '%s' and '%s'.",
-                        mf_dir_path,
-                        mf_candidates[0].name,
-                        mf_candidates[1].name,
-                    )
-                    raise FileExistsError
-
-        # Returns None if no candidate found
-        if not mf_candidates:
-            return None
+        settings: d2_project_config.Settings = d2_project_config.settings
+        mf_dir_path: Path = settings.mf_dir_path
+        mf_extension: str = settings.mf_extension
+
+        # Match names as strings, using cached DirEntry types
+        mf_candidate: os.DirEntry[str] | None = None
+        with os.scandir(mf_dir_path) as it:
+            for entry in it:
+                if not (entry.name.endswith(mf_extension) and entry.is_file()):
+                    continue
+                if mf_candidate is None:
+                    mf_candidate = entry
+                    continue
+
+                # Raise early once a second candidate is found
+                _logger.exception(
+                    "Directory '%s contains too many manifest candidates, "
+                    "including both '%s' and '%s'.",
+                    mf_dir_path,
+                    mf_candidate.name,
+                    entry.name,
+                )
+                raise FileExistsError
 
-        # Must have len(_mf_candidates) == 1
-        return mf_candidates[0]
+        # None if no candidate found; build a Path only for the winner
+        return Path(mf_candidate.path) if mf_candidate is not None else None
 
     @property
     def filename_pattern_expected(self) -> bool | None:
@@ -340,11 +369,10 @@ class InstalledManifestData:
             None: If manifest doesn't exist.
 
         """
-        if self.installed_mf_path and self.installed_mf_path.name:
-            return d2_project_validators.str_matches_pattern(
-                value=self.installed_mf_path.name,
-                pattern=d2_project_config.settings.expected_mf_name_regex,
-            )
+        installed_mf_path: Path | None = self.installed_mf_path
+
+        if installed_mf_path and installed_mf_path.name:
+            return _mf_name_pattern_expected(installed_mf_path.name)
         return None
 
     @property
@@ -358,22 +386,22 @@ class InstalledManifestData:
         """
         expected_checksum: general_schemas.MD5Checksum | None = None
         expected_checksum_str: str
+        installed_mf_path: Path | None = self.installed_mf_path
+
+        if installed_mf_path is None:
+            return expected_checksum
 
-        if self.installed_mf_path and self.filename_pattern_expected:
-            expected_checksum_str = self.installed_mf_path.stem.split("_")[-1]
+        stem: str = installed_mf_path.stem
+
+        # Reuse the scanned path rather than rescanning via the property
+        if _mf_name_pattern_expected(installed_mf_path.name):
+            expected_checksum_str = stem.rpartition("_")[2]
             expected_checksum = general_schemas.MD5Checksum(
                 expected_checksum_str,
             )
-        elif self.installed_mf_path:
-            expected_checksum_str = self.installed_mf_path.stem[-32:]
-
-            d2_project_validators.assert_str_matches_pattern(
-                value=expected_checksum_str,
-                pattern=d2_project_validators.lc_checksum_pattern.pattern,
-                pattern_for=d2_project_validators.lc_checksum_pattern.pattern_for,
-                log_func=_logger.exception,
-            )
-
+        else:
+            # MD5Checksum lowercases and validates the value itself
+            expected_checksum_str = stem[-32:]
             expected_checksum = general_schemas.MD5Checksum(
                 expected_checksum_str,
             )
@@ -405,9 +433,21 @@ class InstalledManifestData:
             None: If no manifest exists.
 
         """
-        if self.expected_checksum and self.computed_checksum:
-            return self.computed_checksum == self.expected_checksum
-        return None
+        # Bind locals as each property access rescans (and rehashes) the
+        # manifest
+        expected_checksum: general_schemas.MD5Checksum | None = (
+            self.expected_checksum
+        )
+        if expected_checksum is None:
+            return None
+
+        computed_checksum: general_schemas.MD5Checksum | None = (
+            self.computed_checksum
+        )
+        if computed_checksum is None:
+            return None
+
+        return computed_checksum == expected_checksum
 
     # ==== Global Methods ====
 
@@ -419,6 +459,10 @@ class InstalledManifestData:
     ) -> InstalledManifestData:
         """Update manifest if update required, or force if flag passed.
 
+        If a backup of the remote manifest already exists locally and its
+        checksum matches the one in its name, it is restored rather than
+        downloaded (unless 'force_update').
+
         Args:
             mf_loc_data (ManifestLocationData): Location data of remote
                 manifest.
@@ -430,28 +474,60 @@ class InstalledManifestData:
                 occured, else new manifest.
 
         """
+        settings: d2_project_config.Settings = d2_project_config.settings
+
+        # A backup of the remote manifest (e.g. after a rollback) can be
+        # restored instead of downloaded, unless an update is forced
+        restore_path: Path = settings.mf_dir_path / (
+            mf_loc_data.remote_mf_name + settings.mf_bak_ext
+        )
+        can_restore: bool = not force_update and restore_path.is_file()
+
+        # Bind locals as each property access rescans the manifest directory
+        installed_mf_path: Path | None = self.installed_mf_path
+
         bak_path: Path | None = (
             general_utils.append_suffix(
-                path=self.installed_mf_path,
-                suffix=d2_project_config.settings.mf_bak_ext,
+                path=installed_mf_path,
+                suffix=settings.mf_bak_ext,
                 overwrite=force_update,
             )
-            if self.installed_mf_path
+            if installed_mf_path
             else None
         )
 
         try:
-            mf_utils.dl_and_extract_mf_zip(
-                url=mf_loc_data.remote_mf_url.url,
-                mf_dir_path=d2_project_config.settings.mf_dir_path,
-                mf_zip_structure=d2_project_config.settings.mf_zip_structure.to_dict(),
-            )
             new_local_manifest: InstalledManifestData = InstalledManifestData()
+            restored: bool = False
+
+            if can_restore:
+                restored_mf_path: Path = general_utils.rm_final_suffix(
+                    path=restore_path,
+                )
+
+                # Checksum is embedded in the name, so verify before keeping
+                restored = bool(new_local_manifest.checksum_match)
+                if not restored:
+                    _logger.warning(
+                        "Backup '%s' failed checksum validation; downloading "
+                        "manifest instead.",
+                        restore_path,
+                    )
+                    general_utils.rm_file(restored_mf_path)
+
+            if not restored:
+                mf_utils.dl_and_extract_mf_zip(
+                    url=mf_loc_data.remote_mf_url.url,
+                    mf_dir_path=settings.mf_dir_path,
+                    mf_zip_structure=_mf_zip_structure_dict(),
+                )
+
+            new_mf_path: Path | None = new_local_manifest.installed_mf_path
             files_to_keep: set[Path] = (
                 {
-                    new_local_manifest.installed_mf_path,
+                    new_mf_path,
                 }
-                if new_local_manifest.installed_mf_path
+                if new_mf_path
                 else set()
             )
 
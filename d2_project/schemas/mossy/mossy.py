@@ -2,26 +2,37 @@
 
 from __future__ import annotations
 
+import html
+import os
 import re
-import shutil
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import requests
-from bs4 import BeautifulSoup
-
 import d2_project.config.config as d2_project_config
 import d2_project.core.logger as d2_project_logger
+import d2_project.core.utils.http as http_utils
 import d2_project.core.validators as d2_project_validators
 
 if TYPE_CHECKING:
     from logging import Logger
     from typing import IO
 
+    import requests
+
 _logger: Logger = d2_project_logger.get_logger(__name__)
 
+# ==== Patterns ====
+_title_regex: re.Pattern[str] = re.compile(
+    r"<title[^>]*>(.*?)</title>",
+    re.IGNORECASE | re.DOTALL,
+)
+_version_regex: re.Pattern[str] = re.compile(r"v[1-9]\d*(?:\.[1-9]\d*)*")
+
+# ==== Mossy CSV Directory ====
+mossy_csv_dir: Path = Path(__file__).resolve().parent
+
 
 @dataclass(frozen=True)
 class CurrentMossyCSV:
@@ -45,7 +56,7 @@ class CurrentMossyCSV:
 
         """
         if self.path is not None:
-            return self.path.stem.split("_")[-1]
+            return self.path.stem.rpartition("_")[2]
         return None
 
     @classmethod
@@ -62,24 +73,33 @@ class CurrentMossyCSV:
             FileExistsError: If too many compatible Mossy CSVs in dir.
 
         """
-        candidates: list[Path] = [
-            file
-            for file in mossy_csv_dir.iterdir()
-            if d2_project_validators.str_matches_pattern(
-                value=file.name,
-                pattern=(
-                    d2_project_validators.mossy_csv_filename_pattern.pattern
-                ),
-            )
-        ]
+        mossy_csv_filename_regex: re.Pattern[str] = (
+            d2_project_validators.mossy_csv_filename_pattern.regex
+        )
 
-        if len(candidates) == 1:
-            return cls(candidates[0])
+        # Match on names only; Path objects are built for the winner alone
+        with os.scandir(mossy_csv_dir) as entries:
+            candidate_names: list[str] = [
+                entry.name
+                for entry in entries
+                if d2_project_validators.str_matches_pattern(
+                    value=entry.name,
+                    pattern=mossy_csv_filename_regex,
+                )
+                and entry.is_file()
+            ]
 
-        if len(candidates) == 0:
+        if len(candidate_names) == 1:
+            return cls(mossy_csv_dir / candidate_names[0])
+
+        if len(candidate_names) == 0:
             return cls(None)
 
-        _logger.error("Too many candidates: %s", candidates)
+        _logger.error(
+            "Too many candidates in '%s': %s",
+            mossy_csv_dir,
+            candidate_names,
+        )
         raise FileExistsError
 
     def update_mossy_csv(
@@ -92,31 +112,35 @@ class CurrentMossyCSV:
         Args:
             force_update (bool): Whether or not to force CSV update.
 
+        Returns:
+            CurrentMossyCSV: Instance for the installed CSV, so callers need
+                not rescan the directory.
+
         """
-        target_path: Path | None = None
+        target_path: Path | None = self.path
+
+        session: requests.Session = http_utils.get_session()
 
-        find_title_response: requests.Response = requests.get(
+        find_title_response: requests.Response = session.get(
             d2_project_config.settings.mossy_find_title_url,
             timeout=5,
         )
 
-        title_tag = BeautifulSoup(
+        title_match: re.Match[str] | None = _title_regex.search(
             find_title_response.text,
-            "html.parser",
-        ).find("title")
+        )
 
-        if title_tag is None:
+        if title_match is None:
             _logger.error("No 'title' tag found in Sheets HTML.")
 
             raise ValueError
 
-        ver_pattern: str = r"^v[1-9]\d*(\.[1-9]\d*)*$"
-        words: list[str] = title_tag.text.split(" ")
+        words: list[str] = html.unescape(title_match.group(1)).split(" ")
 
         versions: list[str] = [
             word
             for word in words
-            if re.fullmatch(ver_pattern, word) is not None
+            if _version_regex.fullmatch(word) is not None
         ]
 
         if len(versions) > 1:
@@ -135,7 +159,7 @@ class CurrentMossyCSV:
                 d2_project_config.settings.mossy_csv_export_url
             )
 
-            response = requests.get(
+            response = session.get(
                 csv_export_url,
                 timeout=5,
             )
@@ -150,8 +174,11 @@ class CurrentMossyCSV:
                 raise ConnectionError
 
             try:
+                # Write next to the target so the final move is a rename
                 with tempfile.NamedTemporaryFile(
                     mode="wb",
+                    dir=mossy_csv_dir,
+                    suffix=".part",
                     delete=False,
                 ) as tmp:
                     tmp_path = tmp.name
@@ -160,15 +187,31 @@ class CurrentMossyCSV:
                 target_path = mossy_csv_dir / (
                     "mossy_csv_" + latest_ver + ".csv"
                 )
-                shutil.move(tmp_path, str(target_path))
+                os.replace(tmp_path, target_path)
+                tmp_path = None  # Consumed by the rename; nothing to clean up
+
+                # Remove superseded CSV so from_dir() finds one candidate
+                if self.path is not None and self.path != target_path:
+                    self.path.unlink(missing_ok=True)
 
             finally:
-                if tmp_path is not None and Path(tmp_path).exists():
-                    Path(tmp_path).unlink()
+                if tmp_path is not None:
+                    Path(tmp_path).unlink(missing_ok=True)
 
         return CurrentMossyCSV(target_path)
 
 
-mossy_csv_dir = Path("d2_project/schemas/mossy")
-current_mossy_csv = CurrentMossyCSV.from_dir(mossy_csv_dir)
-current_mossy_csv.update_mossy_csv(force_update=True)
+def ensure_mossy_csv(*, force_update: bool = False) -> CurrentMossyCSV:
+    """Find the installed Mossy CSV and update it if required.
+
+    Args:
+        force_update (bool): Whether or not to force CSV update (defaults to
+            False).
+
+    Returns:
+        CurrentMossyCSV: Instance for the installed CSV.
+
+    """
+    return CurrentMossyCSV.from_dir(mossy_csv_dir).update_mossy_csv(
+        force_update=force_update,
+    )